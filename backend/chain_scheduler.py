@@ -0,0 +1,164 @@
+# backend/chain_scheduler.py
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from contextlib import asynccontextmanager
+
+# Prioritas: angka kecil = dilayani lebih dulu
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 1
+
+PRIORITIES = {
+    "interactive": PRIORITY_INTERACTIVE,
+    "bulk": PRIORITY_BULK,
+}
+
+
+class ChainBusy(Exception):
+    """
+    Dilempar kalau antrian operasi blockchain penuh / waktu tunggu habis.
+    status_code: 429 untuk request bulk yang di-throttle, 503 kalau lane penuh.
+    """
+
+    def __init__(self, lane: str, status_code: int, retry_after: int, detail: str):
+        super().__init__(detail)
+        self.lane = lane
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.detail = detail
+
+
+class _Lane:
+    """
+    Semaphore berprioritas dengan antrian terbatas untuk satu jenis operasi.
+    Slot yang dilepas langsung diserahkan ke waiter berprioritas tertinggi.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, bulk_queue_share: float):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        # bulk hanya boleh mengisi sebagian antrian, sisanya cadangan untuk UI
+        self.max_bulk_queue = int(max_queue * bulk_queue_share)
+
+        self._active = 0
+        self._waiters = []  # heap of [priority, seq, future]
+        self._seq = itertools.count()
+
+        self.admitted = 0
+        self.rejected = 0
+        self.wait_avg = 0.0
+        self.wait_max = 0.0
+        self.service_avg = 0.0
+
+    def _queued(self, priority: int | None = None) -> int:
+        if priority is None:
+            return len(self._waiters)
+        return sum(1 for w in self._waiters if w[0] == priority)
+
+    def _retry_after(self) -> int:
+        # perkiraan kasar: berapa "gelombang" layanan sampai antrian habis
+        service = self.service_avg or 1.0
+        waves = (len(self._waiters) + 1) / self.max_concurrency
+        return max(1, math.ceil(service * waves))
+
+    def _reject(self, status_code: int, detail: str) -> ChainBusy:
+        self.rejected += 1
+        return ChainBusy(self.name, status_code, self._retry_after(), detail)
+
+    async def acquire(self, priority: int, max_wait: float) -> float:
+        start = time.monotonic()
+
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            self._record_wait(0.0)
+            return 0.0
+
+        if len(self._waiters) >= self.max_queue:
+            raise self._reject(503, f"{self.name} queue is full. Please retry later.")
+        if priority == PRIORITY_BULK and self._queued(PRIORITY_BULK) >= self.max_bulk_queue:
+            raise self._reject(429, f"Too many bulk {self.name} requests queued. Please slow down.")
+
+        fut = asyncio.get_running_loop().create_future()
+        entry = [priority, next(self._seq), fut]
+        heapq.heappush(self._waiters, entry)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(fut), timeout=max_wait)
+        except BaseException as e:
+            if fut.done() and not fut.cancelled():
+                # slot sudah diserahkan tepat saat timeout/cancel → kembalikan
+                self.release()
+            else:
+                fut.cancel()
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            if isinstance(e, asyncio.TimeoutError):
+                raise self._reject(503, f"Timed out waiting for a {self.name} slot.")
+            raise
+
+        waited = time.monotonic() - start
+        self._record_wait(waited)
+        return waited
+
+    def release(self):
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self._active -= 1
+
+    def _record_wait(self, waited: float):
+        self.admitted += 1
+        self.wait_avg += (waited - self.wait_avg) * 0.1
+        self.wait_max = max(self.wait_max, waited)
+
+    def record_service(self, seconds: float):
+        self.service_avg = seconds if not self.service_avg else self.service_avg + (seconds - self.service_avg) * 0.1
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self._active,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": len(self._waiters),
+            "queue_depth_interactive": self._queued(PRIORITY_INTERACTIVE),
+            "queue_depth_bulk": self._queued(PRIORITY_BULK),
+            "max_queue": self.max_queue,
+            "max_bulk_queue": self.max_bulk_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "wait_avg_seconds": round(self.wait_avg, 4),
+            "wait_max_seconds": round(self.wait_max, 4),
+            "service_avg_seconds": round(self.service_avg, 4),
+        }
+
+
+class ChainScheduler:
+    """
+    Admission control di depan operasi blockchain (register / verify).
+    Tiap lane punya batas concurrency dan panjang antrian sendiri.
+    """
+
+    def __init__(self, limits: dict, max_wait: float, bulk_queue_share: float = 0.5):
+        self.max_wait = max_wait
+        self.lanes = {
+            name: _Lane(name, concurrency, queue, bulk_queue_share)
+            for name, (concurrency, queue) in limits.items()
+        }
+
+    @asynccontextmanager
+    async def slot(self, lane: str, priority: int = PRIORITY_INTERACTIVE):
+        l = self.lanes[lane]
+        await l.acquire(priority, self.max_wait)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            l.record_service(time.monotonic() - start)
+            l.release()
+
+    def stats(self) -> dict:
+        return {name: lane.stats() for name, lane in self.lanes.items()}
@@ -0,0 +1,142 @@
+# backend/integrity_sweeper.py
+import hashlib
+import threading
+import time
+from pathlib import Path
+
+# Status hasil pengecekan satu file (dibandingkan dengan baseline path itu sendiri)
+STATUS_OK = "ok"                  # hash sama dengan hash baseline path ini
+STATUS_TAMPERED = "tampered"      # isi file berubah dari baseline
+STATUS_MISSING = "missing"        # path di baseline sudah tidak ada
+STATUS_NEW = "new"                # file belum ada di baseline
+STATUS_UNREGISTERED = "unregistered"  # hash baseline tidak ada di FileRecord user (diset main.py)
+STATUS_ERROR = "error"
+
+ALERT_STATUSES = (STATUS_TAMPERED, STATUS_MISSING, STATUS_UNREGISTERED)
+
+
+class ByteRateLimiter:
+    """
+    Token bucket sederhana (thread-safe) untuk membatasi I/O baca saat sweep.
+    max_bytes_per_sec <= 0 berarti tanpa batas.
+    """
+
+    def __init__(self, max_bytes_per_sec: int):
+        self.rate = max_bytes_per_sec
+        self._allowance = float(max_bytes_per_sec)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, n: int):
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(self.rate, self._allowance + (now - self._last) * self.rate)
+            self._last = now
+            self._allowance -= n
+            deficit = -self._allowance
+        if deficit > 0:
+            time.sleep(deficit / self.rate)
+
+
+def iter_monitored_files(root: Path, recursive: bool):
+    """
+    Yield semua file di bawah root (atau root itu sendiri kalau berupa file),
+    urut supaya hasil sweep stabil.
+    """
+    if root.is_file():
+        yield root
+        return
+
+    pattern = "**/*" if recursive else "*"
+    for path in sorted(root.glob(pattern)):
+        if path.is_file() and not path.is_symlink():
+            yield path
+
+
+def hash_file_sha256_throttled(path: Path, limiter: ByteRateLimiter, chunk_size: int = 65536) -> str:
+    """
+    SHA-256 file (hex string), dengan laju baca dibatasi limiter.
+    """
+    sha = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            limiter.consume(len(chunk))
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def sweep_path(
+    root: Path,
+    recursive: bool,
+    baseline: dict,
+    limiter: ByteRateLimiter,
+    file_pause: float = 0.0,
+) -> list[dict]:
+    """
+    Hash ulang semua file di bawah root dan bandingkan tiap file HANYA dengan
+    hash baseline milik path-nya sendiri. Return list hasil per file, termasuk
+    path baseline yang sudah hilang (missing) dan file baru (new).
+
+    baseline   : file_path (str) -> expected hash yang sudah di-pin
+    file_pause : jeda (detik) antar file supaya sweep tidak memonopoli CPU
+    """
+    if not root.exists() and not baseline:
+        return [{
+            "file_path": str(root),
+            "file_hash": None,
+            "expected_hash": None,
+            "status": STATUS_MISSING,
+            "detail": "Monitored path no longer exists.",
+        }]
+
+    results = []
+    seen = set()
+
+    if root.exists():
+        for path in iter_monitored_files(root, recursive):
+            file_path = str(path)
+            seen.add(file_path)
+            expected = baseline.get(file_path)
+            try:
+                file_hash = hash_file_sha256_throttled(path, limiter)
+            except OSError as e:
+                results.append({
+                    "file_path": file_path,
+                    "file_hash": None,
+                    "expected_hash": expected,
+                    "status": STATUS_ERROR,
+                    "detail": str(e),
+                })
+                continue
+
+            if expected is None:
+                status = STATUS_NEW
+            elif file_hash == expected:
+                status = STATUS_OK
+            else:
+                status = STATUS_TAMPERED
+
+            results.append({
+                "file_path": file_path,
+                "file_hash": file_hash,
+                "expected_hash": expected,
+                "status": status,
+                "detail": None,
+            })
+
+            if file_pause:
+                time.sleep(file_pause)
+
+    for file_path, expected in baseline.items():
+        if file_path not in seen:
+            results.append({
+                "file_path": file_path,
+                "file_hash": None,
+                "expected_hash": expected,
+                "status": STATUS_MISSING,
+                "detail": "File no longer exists.",
+            })
+
+    return results
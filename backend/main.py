@@ -1,4 +1,10 @@
 # backend/main.py
+import asyncio
+import logging
+import os
+import random
+import shutil
+import sys
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -12,8 +18,13 @@ from fastapi import (
     UploadFile,
     File,
     Form,
+    Header,
+    Query,
+    Request,
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -25,11 +36,24 @@ from sqlalchemy import (
     String,
     DateTime,
     ForeignKey,
+    Boolean,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import sessionmaker, declarative_base, relationship, Session
 
 # === IMPORT blockchain client kamu ===
+# Satu client bersama dengan CLI (python_client/), termasuk fast path ABI di fast_abi.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "python_client"))
 from integrity_client import register_file as bc_register_file, verify_file as bc_verify_file
+from chain_scheduler import ChainScheduler, ChainBusy, PRIORITIES, PRIORITY_BULK
+from integrity_sweeper import (
+    ByteRateLimiter,
+    sweep_path,
+    ALERT_STATUSES,
+    STATUS_NEW,
+    STATUS_OK,
+    STATUS_UNREGISTERED,
+)
 
 # ========== CONFIG ==========
 DATABASE_URL = "sqlite:///./app.db"
@@ -37,6 +61,34 @@ SECRET_KEY = "GANTI_INI_DENGAN_SECRET_KEY_YG_KEREN"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 1 hari
 
+# Admission control operasi blockchain: (max concurrency, max antrian)
+CHAIN_REGISTER_LIMITS = (2, 20)
+CHAIN_VERIFY_LIMITS = (8, 100)
+CHAIN_QUEUE_MAX_WAIT = 30  # detik, lebih dari ini → 503
+CHAIN_BULK_QUEUE_SHARE = 0.5  # porsi antrian yang boleh dipakai request bulk
+
+# Sweep integritas terjadwal untuk path di server
+# Path monitor harus di bawah salah satu root ini. Default backend/monitored
+# (relatif ke file ini, bukan working directory); override lewat env
+# SWEEP_ALLOWED_ROOTS, dipisah os.pathsep (":" di Linux/macOS, ";" di Windows).
+SWEEP_ALLOWED_ROOTS = [
+    Path(p).resolve()
+    for p in os.environ.get(
+        "SWEEP_ALLOWED_ROOTS", str(Path(__file__).resolve().parent / "monitored")
+    ).split(os.pathsep)
+    if p
+]
+SWEEP_TICK_SECONDS = 15  # seberapa sering scheduler cek monitor yang jatuh tempo
+SWEEP_MAX_MONITORS_PER_TICK = 5
+SWEEP_MIN_INTERVAL_MINUTES = 5
+SWEEP_JITTER = 0.1  # ±10% interval, supaya sweep tidak jalan serentak
+SWEEP_INITIAL_SPREAD_SECONDS = 60  # sweep pertama disebar acak dalam rentang ini
+SWEEP_MAX_BYTES_PER_SEC = 20 * 1024 * 1024  # batas I/O baca total semua sweep
+SWEEP_FILE_PAUSE = 0.005  # jeda antar file (detik), membatasi pemakaian CPU
+SWEEP_MAX_CHECKS_PER_MONITOR = 5000  # retensi riwayat perubahan status per monitor
+
+logger = logging.getLogger(__name__)
+
 # ========== DB SETUP ==========
 engine = create_engine(
     DATABASE_URL, connect_args={"check_same_thread": False}
@@ -75,6 +127,65 @@ class FileRecord(Base):
 
     user = relationship("User", back_populates="files")
 
+
+class MonitoredPath(Base):
+    __tablename__ = "monitored_paths"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    path = Column(String, nullable=False)
+    recursive = Column(Boolean, nullable=False, default=True)
+    interval_minutes = Column(Integer, nullable=False, default=60)
+    next_run_at = Column(DateTime, nullable=False, index=True)
+    baselined_at = Column(DateTime, nullable=True)  # None = baseline belum di-pin
+    last_run_at = Column(DateTime, nullable=True)
+    last_file_count = Column(Integer, nullable=True)
+    last_alert_count = Column(Integer, nullable=True)
+    last_change_count = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    files = relationship("MonitoredFile", back_populates="monitor", cascade="all, delete-orphan")
+    checks = relationship("IntegrityCheck", back_populates="monitor", cascade="all, delete-orphan")
+
+
+class MonitoredFile(Base):
+    """
+    Baseline per path: hash yang di-pin saat sweep pertama (atau saat file
+    pertama kali muncul), plus status terakhir untuk deteksi perubahan.
+    """
+    __tablename__ = "monitored_files"
+    __table_args__ = (UniqueConstraint("monitor_id", "file_path"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    monitor_id = Column(Integer, ForeignKey("monitored_paths.id"), nullable=False, index=True)
+    file_path = Column(String, nullable=False)
+    expected_hash = Column(String, nullable=True)
+    # apakah hash baseline juga terdaftar sebagai FileRecord milik user
+    registered = Column(Boolean, nullable=False, default=False)
+    last_status = Column(String, nullable=True)
+    last_hash = Column(String, nullable=True)
+    pinned_at = Column(DateTime, nullable=True)
+    last_checked_at = Column(DateTime, nullable=True)
+
+    monitor = relationship("MonitoredPath", back_populates="files")
+
+
+class IntegrityCheck(Base):
+    __tablename__ = "integrity_checks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    monitor_id = Column(Integer, ForeignKey("monitored_paths.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    file_path = Column(String, nullable=False)
+    file_hash = Column(String, nullable=True)
+    expected_hash = Column(String, nullable=True)
+    previous_status = Column(String, nullable=True)
+    status = Column(String, nullable=False, index=True)
+    detail = Column(String, nullable=True)
+    checked_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    monitor = relationship("MonitoredPath", back_populates="checks")
+
 Base.metadata.create_all(bind=engine)
 
 # ========== SECURITY / AUTH ==========
@@ -98,6 +209,25 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
+def reserve_credit(db: Session, user_id: int) -> bool:
+    # UPDATE ... WHERE credits > 0 atomik di DB: tidak ada race antar request
+    updated = (
+        db.query(User)
+        .filter(User.id == user_id, User.credits > 0)
+        .update({User.credits: User.credits - 1}, synchronize_session=False)
+    )
+    db.commit()
+    return updated == 1
+
+
+def refund_credit(db: Session, user_id: int):
+    db.rollback()
+    db.query(User).filter(User.id == user_id).update(
+        {User.credits: User.credits + 1}, synchronize_session=False
+    )
+    db.commit()
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
@@ -129,6 +259,197 @@ def get_current_user(
     return user
 
 
+# ========== CHAIN ADMISSION CONTROL ==========
+chain_scheduler = ChainScheduler(
+    {
+        "register": CHAIN_REGISTER_LIMITS,
+        "verify": CHAIN_VERIFY_LIMITS,
+    },
+    max_wait=CHAIN_QUEUE_MAX_WAIT,
+    bulk_queue_share=CHAIN_BULK_QUEUE_SHARE,
+)
+
+
+def get_priority(x_priority: Optional[str] = Header(None)) -> int:
+    # Frontend mengirim "X-Priority: interactive"; caller lain (script, job bulk)
+    # yang tidak mengirim header diperlakukan sebagai bulk.
+    if x_priority is None:
+        return PRIORITY_BULK
+    return PRIORITIES.get(x_priority.lower(), PRIORITY_BULK)
+
+
+def save_upload_to_temp(file: UploadFile) -> Path:
+    # Dipanggil di threadpool: copy streaming dari file upload yang sudah di-spool
+    # Starlette, tanpa membaca seluruh isi ke memori dan tanpa blocking event loop.
+    suffix = Path(file.filename).suffix
+    file.file.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        shutil.copyfileobj(file.file, tmp)
+        return Path(tmp.name)
+
+
+# ========== INTEGRITY SWEEPS ==========
+sweep_limiter = ByteRateLimiter(SWEEP_MAX_BYTES_PER_SEC)
+
+
+def next_sweep_time(interval_minutes: int, now: Optional[datetime] = None) -> datetime:
+    now = now or datetime.utcnow()
+    jitter = random.uniform(-SWEEP_JITTER, SWEEP_JITTER)
+    return now + timedelta(minutes=interval_minutes * (1 + jitter))
+
+
+def resolve_monitored_path(raw_path: str) -> Path:
+    path = Path(raw_path).resolve()
+    if not any(path.is_relative_to(root) for root in SWEEP_ALLOWED_ROOTS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Path is outside the allowed monitoring roots.",
+        )
+    if not path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Path does not exist on the server.",
+        )
+    return path
+
+
+def run_monitor_sweep(db: Session, monitor: MonitoredPath) -> int:
+    """
+    Sweep satu monitor tanpa koneksi ke node: tiap file dibandingkan dengan hash
+    baseline path-nya sendiri (monitored_files). Hash yang di-pin harus terdaftar
+    sebagai FileRecord milik user; kalau tidak, file berstatus "unregistered" (alert).
+    Yang disimpan ke integrity_checks hanya perubahan status. Return jumlah alert.
+    """
+    files = {f.file_path: f for f in monitor.files}
+    baseline = {p: f.expected_hash for p, f in files.items() if f.expected_hash is not None}
+    known_hashes = {
+        h for (h,) in db.query(FileRecord.file_hash).filter(FileRecord.user_id == monitor.user_id)
+    }
+    first_sweep = monitor.baselined_at is None
+
+    results = sweep_path(
+        Path(monitor.path),
+        monitor.recursive,
+        baseline,
+        sweep_limiter,
+        SWEEP_FILE_PAUSE,
+    )
+
+    checked_at = datetime.utcnow()
+    changes = 0
+    alerts = 0
+    for r in results:
+        f = files.get(r["file_path"])
+        if f is None:
+            f = MonitoredFile(monitor_id=monitor.id, file_path=r["file_path"])
+            monitor.files.append(f)
+
+        pinned_now = r["status"] == STATUS_NEW
+        status_now = r["status"]
+        if pinned_now:
+            f.expected_hash = r["file_hash"]
+            f.pinned_at = checked_at
+            status_now = STATUS_OK
+
+        # dicek ulang tiap sweep: file yang belakangan diregister jadi ok
+        if f.expected_hash is not None:
+            f.registered = f.expected_hash in known_hashes
+        if status_now == STATUS_OK and not f.registered:
+            status_now = STATUS_UNREGISTERED
+
+        if pinned_now:
+            # sweep pertama: hanya pin yang tidak terdaftar yang dicatat;
+            # setelahnya file baru selalu dicatat
+            record = not first_sweep or status_now != STATUS_OK
+            recorded_status = STATUS_NEW if status_now == STATUS_OK else status_now
+        else:
+            record = status_now != f.last_status
+            recorded_status = status_now
+
+        if record:
+            changes += 1
+            db.add(IntegrityCheck(
+                monitor_id=monitor.id,
+                user_id=monitor.user_id,
+                previous_status=f.last_status,
+                checked_at=checked_at,
+                **{**r, "status": recorded_status},
+            ))
+
+        if status_now in ALERT_STATUSES:
+            alerts += 1
+        f.last_status = status_now
+        f.last_hash = r["file_hash"]
+        f.last_checked_at = checked_at
+
+    # Baris tanpa baseline (mis. hasil "root monitor hilang" atau file yang gagal
+    # dibaca) yang tidak muncul lagi di sweep ini sudah tidak relevan → hapus.
+    seen = {r["file_path"] for r in results}
+    for path, f in files.items():
+        if f.expected_hash is None and path not in seen:
+            monitor.files.remove(f)
+
+    monitor.baselined_at = monitor.baselined_at or checked_at
+    monitor.last_run_at = checked_at
+    monitor.last_file_count = len(results)
+    monitor.last_alert_count = alerts
+    monitor.last_change_count = changes
+    monitor.next_run_at = next_sweep_time(monitor.interval_minutes, checked_at)
+    db.flush()
+
+    # retensi: simpan hanya N perubahan terbaru per monitor
+    cutoff = (
+        db.query(IntegrityCheck.id)
+        .filter(IntegrityCheck.monitor_id == monitor.id)
+        .order_by(IntegrityCheck.id.desc())
+        .offset(SWEEP_MAX_CHECKS_PER_MONITOR)
+        .limit(1)
+        .scalar()
+    )
+    if cutoff is not None:
+        db.query(IntegrityCheck).filter(
+            IntegrityCheck.monitor_id == monitor.id,
+            IntegrityCheck.id <= cutoff,
+        ).delete(synchronize_session=False)
+
+    db.commit()
+    if alerts:
+        logger.warning("Monitor %s: %d integrity alert(s) at %s", monitor.id, alerts, monitor.path)
+    return alerts
+
+
+def run_due_sweeps():
+    db = SessionLocal()
+    try:
+        due = (
+            db.query(MonitoredPath)
+            .filter(MonitoredPath.next_run_at <= datetime.utcnow())
+            .order_by(MonitoredPath.next_run_at)
+            .limit(SWEEP_MAX_MONITORS_PER_TICK)
+            .all()
+        )
+        for monitor in due:
+            try:
+                run_monitor_sweep(db, monitor)
+            except Exception:
+                db.rollback()
+                logger.exception("Sweep failed for monitor %s", monitor.id)
+                monitor.next_run_at = next_sweep_time(monitor.interval_minutes)
+                db.commit()
+    finally:
+        db.close()
+
+
+async def sweep_scheduler_loop():
+    # satu sweep berjalan pada satu waktu, di threadpool supaya API tetap responsif
+    while True:
+        await asyncio.sleep(SWEEP_TICK_SECONDS)
+        try:
+            await run_in_threadpool(run_due_sweeps)
+        except Exception:
+            logger.exception("Sweep scheduler error")
+
+
 # ========== SCHEMAS ==========
 class UserCreate(BaseModel):
     email: EmailStr
@@ -170,6 +491,58 @@ class VerifyResultOut(BaseModel):
     record: Optional[dict]
 
 
+class MonitoredPathCreate(BaseModel):
+    path: str
+    recursive: bool = True
+    interval_minutes: int = 60
+
+
+class MonitoredPathOut(BaseModel):
+    id: int
+    path: str
+    recursive: bool
+    interval_minutes: int
+    next_run_at: datetime
+    baselined_at: Optional[datetime] = None
+    last_run_at: Optional[datetime] = None
+    last_file_count: Optional[int] = None
+    last_alert_count: Optional[int] = None
+    last_change_count: Optional[int] = None
+    created_at: datetime
+
+    class Config:
+        orm_mode = True
+
+
+class MonitoredFileOut(BaseModel):
+    id: int
+    file_path: str
+    expected_hash: Optional[str] = None
+    registered: bool
+    last_status: Optional[str] = None
+    last_hash: Optional[str] = None
+    pinned_at: Optional[datetime] = None
+    last_checked_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
+
+class IntegrityCheckOut(BaseModel):
+    id: int
+    monitor_id: int
+    file_path: str
+    file_hash: Optional[str] = None
+    expected_hash: Optional[str] = None
+    previous_status: Optional[str] = None
+    status: str
+    detail: Optional[str] = None
+    checked_at: datetime
+
+    class Config:
+        orm_mode = True
+
+
 # ========== APP ==========
 app = FastAPI(title="Blockchain File Integrity Registry API")
 
@@ -179,9 +552,31 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After"],
 )
 
 
+@app.on_event("startup")
+async def start_sweep_scheduler():
+    for root in SWEEP_ALLOWED_ROOTS:
+        root.mkdir(parents=True, exist_ok=True)
+    app.state.sweep_task = asyncio.create_task(sweep_scheduler_loop())
+
+
+@app.on_event("shutdown")
+async def stop_sweep_scheduler():
+    app.state.sweep_task.cancel()
+
+
+@app.exception_handler(ChainBusy)
+async def chain_busy_handler(request: Request, exc: ChainBusy):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 @app.post("/auth/register", response_model=UserOut)
 def register_user(payload: UserCreate, db: Session = Depends(get_db)):
     existing = db.query(User).filter(User.email == payload.email.lower()).first()
@@ -227,30 +622,35 @@ def get_me(current_user: User = Depends(get_current_user)):
 async def register_file(
     file: UploadFile = File(...),
     metadata: str = Form(""),
+    priority: int = Depends(get_priority),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    if current_user.credits <= 0:
+    # kredit di-reserve sebelum masuk antrian, supaya request yang menunggu
+    # bersamaan tidak bisa memakai kredit yang sama
+    if not reserve_credit(db, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_402_PAYMENT_REQUIRED,
             detail="No credits remaining. Please top up.",
         )
 
-    suffix = Path(file.filename).suffix
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        contents = await file.read()
-        tmp.write(contents)
-        tmp_path = Path(tmp.name)
-
     try:
-        result = bc_register_file(str(tmp_path), metadata)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Blockchain error: {e}",
-        )
+        async with chain_scheduler.slot("register", priority):
+            tmp_path = await run_in_threadpool(save_upload_to_temp, file)
+            try:
+                result = await run_in_threadpool(bc_register_file, str(tmp_path), metadata)
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Blockchain error: {e}",
+                )
+            finally:
+                tmp_path.unlink(missing_ok=True)
+    except BaseException:
+        # ChainBusy, error blockchain, atau request dibatalkan → kembalikan kredit
+        refund_credit(db, current_user.id)
+        raise
 
-    current_user.credits -= 1
     record = FileRecord(
          user_id=current_user.id,
          filename=file.filename,
@@ -260,7 +660,6 @@ async def register_file(
          metadata_=metadata,
     )
     db.add(record)
-    db.add(current_user)
     db.commit()
     db.refresh(record)
 
@@ -270,20 +669,19 @@ async def register_file(
 @app.post("/files/verify", response_model=VerifyResultOut)
 async def verify_file(
     file: UploadFile = File(...),
+    priority: int = Depends(get_priority),
 ):
-    suffix = Path(file.filename).suffix
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        contents = await file.read()
-        tmp.write(contents)
-        tmp_path = Path(tmp.name)
-
-    try:
-        result = bc_verify_file(str(tmp_path))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Blockchain error: {e}",
-        )
+    async with chain_scheduler.slot("verify", priority):
+        tmp_path = await run_in_threadpool(save_upload_to_temp, file)
+        try:
+            result = await run_in_threadpool(bc_verify_file, str(tmp_path))
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Blockchain error: {e}",
+            )
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
     return VerifyResultOut(
         filename=file.filename,
@@ -306,3 +704,146 @@ def list_files(
         .all()
     )
     return records
+
+
+@app.get("/chain/queues")
+def chain_queues():
+    """
+    Kedalaman antrian, slot aktif dan waktu tunggu per lane (register / verify).
+    """
+    return chain_scheduler.stats()
+
+
+def get_user_monitor(monitor_id: int, db: Session, user: User) -> MonitoredPath:
+    monitor = (
+        db.query(MonitoredPath)
+        .filter(MonitoredPath.id == monitor_id, MonitoredPath.user_id == user.id)
+        .first()
+    )
+    if not monitor:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Monitor not found.",
+        )
+    return monitor
+
+
+@app.post("/monitors", response_model=MonitoredPathOut)
+def create_monitor(
+    payload: MonitoredPathCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    if payload.interval_minutes < SWEEP_MIN_INTERVAL_MINUTES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Interval must be at least {SWEEP_MIN_INTERVAL_MINUTES} minutes.",
+        )
+
+    path = resolve_monitored_path(payload.path)
+    spread = min(SWEEP_INITIAL_SPREAD_SECONDS, payload.interval_minutes * 60)
+    monitor = MonitoredPath(
+        user_id=current_user.id,
+        path=str(path),
+        recursive=payload.recursive,
+        interval_minutes=payload.interval_minutes,
+        next_run_at=datetime.utcnow() + timedelta(seconds=random.uniform(0, spread)),
+    )
+    db.add(monitor)
+    db.commit()
+    db.refresh(monitor)
+    return monitor
+
+
+@app.get("/monitors", response_model=List[MonitoredPathOut])
+def list_monitors(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return (
+        db.query(MonitoredPath)
+        .filter(MonitoredPath.user_id == current_user.id)
+        .order_by(MonitoredPath.created_at.desc())
+        .all()
+    )
+
+
+@app.delete("/monitors/{monitor_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_monitor(
+    monitor_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    monitor = get_user_monitor(monitor_id, db, current_user)
+    db.delete(monitor)
+    db.commit()
+
+
+@app.post("/monitors/{monitor_id}/run", response_model=MonitoredPathOut)
+def trigger_monitor(
+    monitor_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Jadwalkan sweep secepatnya (dijalankan oleh scheduler di tick berikutnya).
+    """
+    monitor = get_user_monitor(monitor_id, db, current_user)
+    monitor.next_run_at = datetime.utcnow()
+    db.commit()
+    db.refresh(monitor)
+    return monitor
+
+
+@app.post("/monitors/{monitor_id}/rebaseline", response_model=MonitoredPathOut)
+def rebaseline_monitor(
+    monitor_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Terima kondisi file saat ini sebagai baseline baru (mis. setelah perubahan
+    yang sah). Baseline di-pin ulang oleh sweep berikutnya.
+    """
+    monitor = get_user_monitor(monitor_id, db, current_user)
+    monitor.files.clear()
+    monitor.baselined_at = None
+    monitor.next_run_at = datetime.utcnow()
+    db.commit()
+    db.refresh(monitor)
+    return monitor
+
+
+@app.get("/monitors/{monitor_id}/files", response_model=List[MonitoredFileOut])
+def list_monitored_files(
+    monitor_id: int,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    limit: int = Query(1000, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    monitor = get_user_monitor(monitor_id, db, current_user)
+    query = db.query(MonitoredFile).filter(MonitoredFile.monitor_id == monitor.id)
+    if status_filter is not None:
+        query = query.filter(MonitoredFile.last_status == status_filter)
+    return query.order_by(MonitoredFile.file_path).limit(limit).all()
+
+
+@app.get("/integrity-checks", response_model=List[IntegrityCheckOut])
+def list_integrity_checks(
+    monitor_id: Optional[int] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    alerts_only: bool = False,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    query = db.query(IntegrityCheck).filter(IntegrityCheck.user_id == current_user.id)
+    if monitor_id is not None:
+        query = query.filter(IntegrityCheck.monitor_id == monitor_id)
+    if status_filter is not None:
+        query = query.filter(IntegrityCheck.status == status_filter)
+    if alerts_only:
+        query = query.filter(IntegrityCheck.status.in_(ALERT_STATUSES))
+
+    return query.order_by(IntegrityCheck.checked_at.desc()).limit(limit).all()
@@ -3,6 +3,8 @@ import axios from "axios";
 
 const api = axios.create({
   baseURL: "http://localhost:8000", // backend FastAPI kamu
+  // request dari UI dilayani lebih dulu daripada job bulk (lihat backend chain_scheduler)
+  headers: { "X-Priority": "interactive" },
 });
 
 // Tambah token JWT ke setiap request jika ada
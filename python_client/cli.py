@@ -1,8 +1,12 @@
 import argparse
-from integrity_client import register_file, verify_file
+
+# integrity_client langsung konek ke node saat di-import,
+# jadi di-import per command supaya "verify --offline" bisa jalan tanpa RPC.
 
 
 def cmd_register(args):
+    from integrity_client import register_file
+
     result = register_file(args.file, args.metadata or "")
 
     print("\n[REGISTER]")
@@ -13,11 +17,38 @@ def cmd_register(args):
 
 
 def cmd_verify(args):
-    result = verify_file(args.file)
+    if args.offline:
+        from offline_bundle import OfflineBundle, verify_file_offline
+
+        with OfflineBundle(args.offline, trusted_signer=args.trusted_signer) as bundle:
+            result = verify_file_offline(args.file, bundle)
+            source = f"bundle @ block {bundle.block_number} (0x{bundle.block_hash.hex()})"
+            if bundle.signer is None:
+                signed_by = "UNSIGNED"
+            elif not bundle.signature_valid:
+                signed_by = f"{bundle.signer} (INVALID SIGNATURE)"
+            elif bundle.trusted:
+                signed_by = f"{bundle.signer} (TRUSTED)"
+            elif bundle.trusted_signer is None:
+                signed_by = f"{bundle.signer} (NOT TRUSTED: no --trusted-signer given)"
+            else:
+                signed_by = f"{bundle.signer} (NOT TRUSTED: expected {bundle.trusted_signer})"
+    else:
+        from integrity_client import verify_file
+
+        result = verify_file(args.file)
+        source = None
 
     print("\n[VERIFY]")
     print(" File       :", result["file_path"])
     print(" Hash       :", result["file_hash"])
+    if source is not None:
+        print(" Source     :", source)
+        print(" Signed by  :", signed_by)
+
+    if source is not None and not result["trusted"]:
+        print(" Status     : UNVERIFIED (bundle is not signed by a trusted signer)")
+        raise SystemExit(1)
 
     if not result["on_chain"]:
         print(" Status     : NOT REGISTERED on blockchain")
@@ -27,10 +58,31 @@ def cmd_verify(args):
     print(" Status     : REGISTERED")
     print(" Owner      :", rec["owner"])
     print(" Timestamp  :", rec["timestamp_iso"])
-    print(" Metadata   :", rec["metadata"])
+    if rec["metadata"] is not None:
+        print(" Metadata   :", rec["metadata"])
     print(" Match      :", "YES" if result["match"] else "NO (POSSIBLE TAMPER)")
 
 
+def cmd_export_bundle(args):
+    from integrity_client import w3, contract, DEFAULT_ACCOUNT
+    from offline_bundle import export_bundle
+
+    result = export_bundle(
+        w3,
+        contract,
+        args.output,
+        block_number=args.block,
+        signer=None if args.no_sign else DEFAULT_ACCOUNT,
+    )
+
+    print("\n[EXPORT BUNDLE]")
+    print(" Bundle     :", result["bundle_path"])
+    print(" Records    :", result["record_count"])
+    print(" Block no   :", result["block_number"])
+    print(" Block hash :", result["block_hash"])
+    print(" Signed by  :", result["signer"] or "UNSIGNED")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Blockchain-based File Integrity Tool (Ganache + Solidity)"
@@ -54,8 +106,37 @@ def main():
         help="Verifikasi integritas file terhadap data di blockchain",
     )
     p_ver.add_argument("file", help="Path ke file")
+    p_ver.add_argument(
+        "--offline",
+        metavar="BUNDLE",
+        help="Verifikasi terhadap bundle snapshot (tanpa koneksi ke node)",
+    )
+    p_ver.add_argument(
+        "--trusted-signer",
+        metavar="ADDRESS",
+        help="Address yang wajib menandatangani bundle (wajib untuk --offline)",
+    )
     p_ver.set_defaults(func=cmd_verify)
 
+    # Subcommand: export-bundle
+    p_exp = subparsers.add_parser(
+        "export-bundle",
+        help="Export snapshot record ke bundle biner untuk verifikasi offline",
+    )
+    p_exp.add_argument("output", help="Path file bundle output")
+    p_exp.add_argument(
+        "-b",
+        "--block",
+        type=int,
+        help="Nomor block snapshot (default: block terbaru)",
+    )
+    p_exp.add_argument(
+        "--no-sign",
+        action="store_true",
+        help="Jangan tandatangani bundle dengan akun default",
+    )
+    p_exp.set_defaults(func=cmd_export_bundle)
+
     args = parser.parse_args()
     args.func(args)
 
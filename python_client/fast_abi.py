@@ -0,0 +1,75 @@
+from web3 import Web3
+
+# ---- Fast path ABI untuk registerFile / getFileRecord ----
+#
+# Kedua fungsi punya signature tetap (string, string) dan (string), jadi calldata
+# bisa di-encode langsung tanpa lewat contract.functions.X(...) milik web3
+# (lookup ABI, validasi argumen, encoder generik) di setiap panggilan.
+# Kesamaan dengan encoder/decoder web3 diuji di tests/test_fast_abi.py.
+
+REGISTER_FILE_SIGNATURE = "registerFile(string,string)"
+GET_FILE_RECORD_SIGNATURE = "getFileRecord(string)"
+
+REGISTER_FILE_SELECTOR = bytes(Web3.keccak(text=REGISTER_FILE_SIGNATURE))[:4]
+GET_FILE_RECORD_SELECTOR = bytes(Web3.keccak(text=GET_FILE_RECORD_SIGNATURE))[:4]
+
+_WORD = 32
+_ONE_ARG_HEAD = (1 * _WORD).to_bytes(_WORD, "big")
+_TWO_ARG_HEAD = (2 * _WORD).to_bytes(_WORD, "big")
+
+
+def _encode_string(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return len(data).to_bytes(_WORD, "big") + data + b"\x00" * (-len(data) % _WORD)
+
+
+def _decode_word(data: bytes, offset: int) -> int:
+    if offset < 0 or offset + _WORD > len(data):
+        raise ValueError(f"ABI word at offset {offset} out of bounds")
+    return int.from_bytes(data[offset:offset + _WORD], "big")
+
+
+def _decode_string(data: bytes, head_offset: int) -> str:
+    offset = _decode_word(data, head_offset)
+    length = _decode_word(data, offset)
+    start = offset + _WORD
+    if start + length > len(data):
+        raise ValueError("ABI string out of bounds")
+    return data[start:start + length].decode("utf-8")
+
+
+def encode_register_file(file_hash: str, metadata: str) -> bytes:
+    """
+    Calldata untuk registerFile(string fileHash, string metadata).
+    """
+    enc_hash = _encode_string(file_hash)
+    enc_meta = _encode_string(metadata)
+    meta_offset = (2 * _WORD + len(enc_hash)).to_bytes(_WORD, "big")
+    return REGISTER_FILE_SELECTOR + _TWO_ARG_HEAD + meta_offset + enc_hash + enc_meta
+
+
+def encode_get_file_record(file_hash: str) -> bytes:
+    """
+    Calldata untuk getFileRecord(string fileHash).
+    """
+    return GET_FILE_RECORD_SELECTOR + _ONE_ARG_HEAD + _encode_string(file_hash)
+
+
+def decode_get_file_record(data: bytes) -> tuple:
+    """
+    Decode return getFileRecord: (address owner, uint256 timestamp,
+    string storedHash, string metadata). Owner dikembalikan sebagai checksum address
+    seperti hasil contract.functions.getFileRecord(...).call().
+    """
+    data = bytes(data)
+    if len(data) < 4 * _WORD:
+        raise ValueError("Return data too short for getFileRecord")
+
+    # address = 20 byte terakhir; 12 byte padding harus nol (decoder strict web3 juga menolak)
+    if any(data[:12]):
+        raise ValueError("Non-empty padding bytes in ABI address")
+    owner = Web3.to_checksum_address("0x" + data[12:_WORD].hex())
+    timestamp = _decode_word(data, _WORD)
+    stored_hash = _decode_string(data, 2 * _WORD)
+    metadata = _decode_string(data, 3 * _WORD)
+    return owner, timestamp, stored_hash, metadata
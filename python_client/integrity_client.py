@@ -4,6 +4,8 @@ import json
 import hashlib
 from datetime import datetime, timezone
 
+from fast_abi import encode_register_file, encode_get_file_record, decode_get_file_record
+
 # ---- Konfigurasi dasar ----
 
 # RPC Ganache lokal (harus sama dengan waktu kamu menjalankan: npx ganache -p 8546)
@@ -68,8 +70,13 @@ def register_file(file_path: str, metadata: str = "") -> dict:
     file_hash = hash_file_sha256(file_path)
     print(f"[+] File hash (SHA-256): {file_hash}")
 
-    tx_hash = contract.functions.registerFile(file_hash, metadata).transact(
-        {"from": DEFAULT_ACCOUNT}
+    # fast path: calldata di-encode langsung (lihat fast_abi.py)
+    tx_hash = w3.eth.send_transaction(
+        {
+            "from": DEFAULT_ACCOUNT,
+            "to": CONTRACT_ADDRESS,
+            "data": encode_register_file(file_hash, metadata),
+        }
     )
     receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
 
@@ -87,9 +94,10 @@ def get_file_record(file_hash: str) -> dict | None:
     Return dict atau None jika tidak ada.
     """
     try:
-        owner, timestamp, stored_hash, metadata = contract.functions.getFileRecord(
-            file_hash
-        ).call()
+        raw = w3.eth.call(
+            {"to": CONTRACT_ADDRESS, "data": encode_get_file_record(file_hash)}
+        )
+        owner, timestamp, stored_hash, metadata = decode_get_file_record(raw)
     except Exception:
         return None
 
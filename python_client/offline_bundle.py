@@ -0,0 +1,292 @@
+import hashlib
+import mmap
+import struct
+from datetime import datetime, timezone
+from pathlib import Path
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from web3 import Web3
+
+# ---- Format bundle ----
+#
+# Header (HEADER_SIZE byte, big-endian):
+#   magic (8) | version (u32) | record_count (u32) | block_number (u64)
+#   block_hash (32) | records_digest (32) | signer (20) | signature (65)
+#   ... padding nol sampai HEADER_SIZE
+#
+# Setelah header: record_count record berukuran tetap, terurut berdasarkan id:
+#   id (bytes32) | owner (20) | timestamp (u64)
+#
+# id = keccak256(fileHash) persis seperti key mapping di kontrak, jadi lookup
+# offline cukup binary search di atas file yang di-mmap tanpa parsing apapun.
+
+MAGIC = b"FIRBNDL1"
+VERSION = 1
+
+_HEADER_STRUCT = struct.Struct(">8sIIQ32s32s20s65s")
+HEADER_SIZE = 256
+
+_RECORD_STRUCT = struct.Struct(">32s20sQ")
+RECORD_SIZE = _RECORD_STRUCT.size
+
+FILE_REGISTERED_TOPIC = Web3.keccak(
+    text="FileRegistered(bytes32,address,string,string,uint256)"
+)
+
+_DIGEST_CHUNK = 1024 * 1024
+
+_ZERO_SIGNATURE = b"\x00" * 65
+_ZERO_ADDRESS = b"\x00" * 20
+
+
+def record_id(file_hash: str) -> bytes:
+    """
+    Hitung id record (bytes32) dari hash file, sama dengan
+    keccak256(abi.encodePacked(fileHash)) di kontrak.
+    """
+    return bytes(Web3.keccak(text=file_hash))
+
+
+def _signing_message(block_number: int, block_hash: bytes, count: int, digest: bytes) -> bytes:
+    return hashlib.sha256(
+        MAGIC
+        + struct.pack(">IIQ", VERSION, count, block_number)
+        + block_hash
+        + digest
+    ).digest()
+
+
+# ---- Export (butuh node) ----
+
+def export_bundle(w3, contract, out_path: str, block_number: int | None = None, signer: str | None = None) -> dict:
+    """
+    Ambil semua event FileRegistered sampai block_number (default: block terbaru),
+    lalu tulis snapshot terurut ke out_path.
+    Kalau signer diberikan, header ditandatangani dengan eth_sign akun tersebut.
+    """
+    if block_number is None:
+        block_number = w3.eth.block_number
+
+    block = w3.eth.get_block(block_number)
+    block_hash = bytes(block["hash"])
+
+    event = contract.events.FileRegistered()
+    logs = w3.eth.get_logs(
+        {
+            "address": contract.address,
+            "fromBlock": 0,
+            "toBlock": block_number,
+            "topics": [FILE_REGISTERED_TOPIC],
+        }
+    )
+
+    records = {}
+    for log in logs:
+        args = event.process_log(log)["args"]
+        records[bytes(args["id"])] = (
+            bytes.fromhex(args["owner"][2:]),
+            args["timestamp"],
+        )
+
+    body = b"".join(
+        _RECORD_STRUCT.pack(rid, owner, ts)
+        for rid, (owner, ts) in sorted(records.items())
+    )
+    digest = hashlib.sha256(body).digest()
+
+    signer_bytes = _ZERO_ADDRESS
+    signature = _ZERO_SIGNATURE
+    if signer is not None:
+        message = _signing_message(block_number, block_hash, len(records), digest)
+        signature = bytes(w3.eth.sign(signer, data=message))
+        signer_bytes = bytes.fromhex(Web3.to_checksum_address(signer)[2:])
+
+    header = _HEADER_STRUCT.pack(
+        MAGIC,
+        VERSION,
+        len(records),
+        block_number,
+        block_hash,
+        digest,
+        signer_bytes,
+        signature,
+    ).ljust(HEADER_SIZE, b"\x00")
+
+    path = Path(out_path)
+    with path.open("wb") as f:
+        f.write(header)
+        f.write(body)
+
+    return {
+        "bundle_path": str(path),
+        "record_count": len(records),
+        "block_number": block_number,
+        "block_hash": "0x" + block_hash.hex(),
+        "signer": Web3.to_checksum_address(signer) if signer is not None else None,
+    }
+
+
+# ---- Verifikasi offline (tanpa RPC) ----
+
+class OfflineBundle:
+    """
+    Snapshot record yang di-mmap read-only. Lookup = binary search O(log n)
+    langsung di atas buffer, tanpa node dan tanpa memuat seluruh file ke memori.
+
+    Signer di header hanya informasi; bundle baru dipercaya (trusted = True) kalau
+    signature valid DAN address hasil recover sama dengan trusted_signer.
+    """
+
+    def __init__(self, bundle_path: str, check_digest: bool = True, trusted_signer: str | None = None):
+        path = Path(bundle_path)
+        if not path.is_file():
+            raise FileNotFoundError(f"Bundle not found: {bundle_path}")
+
+        self.path = path
+        self._file = path.open("rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{bundle_path} bukan bundle yang valid (file kosong).")
+
+        if len(self._mm) < HEADER_SIZE:
+            self.close()
+            raise ValueError(f"{bundle_path} bukan bundle yang valid (header terpotong).")
+
+        (
+            magic,
+            version,
+            self.record_count,
+            self.block_number,
+            self.block_hash,
+            self.records_digest,
+            signer,
+            self._signature,
+        ) = _HEADER_STRUCT.unpack_from(self._mm, 0)
+
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{bundle_path} bukan bundle yang valid (magic/version).")
+
+        if len(self._mm) != HEADER_SIZE + self.record_count * RECORD_SIZE:
+            self.close()
+            raise ValueError(f"{bundle_path} rusak: ukuran tidak sesuai jumlah record.")
+
+        if check_digest:
+            # hash per chunk supaya body tidak pernah disalin utuh ke memori
+            sha = hashlib.sha256()
+            for offset in range(HEADER_SIZE, len(self._mm), _DIGEST_CHUNK):
+                sha.update(self._mm[offset:offset + _DIGEST_CHUNK])
+            if sha.digest() != self.records_digest:
+                self.close()
+                raise ValueError(f"{bundle_path} rusak: digest record tidak cocok.")
+
+        self.signer = None
+        self.signature_valid = None
+        if self._signature != _ZERO_SIGNATURE:
+            self.signer = Web3.to_checksum_address("0x" + signer.hex())
+            self.signature_valid = self._recover_signer() == self.signer
+
+        self.trusted_signer = (
+            Web3.to_checksum_address(trusted_signer) if trusted_signer is not None else None
+        )
+        self.trusted = bool(
+            self.signature_valid
+            and self.trusted_signer is not None
+            and self.signer == self.trusted_signer
+        )
+
+    def _recover_signer(self) -> str | None:
+        message = _signing_message(
+            self.block_number, self.block_hash, self.record_count, self.records_digest
+        )
+        sig = bytearray(self._signature)
+        if sig[64] < 27:
+            sig[64] += 27
+        try:
+            return Account.recover_message(encode_defunct(primitive=message), signature=bytes(sig))
+        except Exception:
+            return None
+
+    def _key_at(self, index: int) -> bytes:
+        offset = HEADER_SIZE + index * RECORD_SIZE
+        return self._mm[offset:offset + 32]
+
+    def lookup(self, file_hash: str) -> dict | None:
+        """
+        Cari record berdasarkan hash file (hex string).
+        Return dict owner/timestamp atau None jika tidak ada di snapshot.
+        """
+        rid = record_id(file_hash)
+
+        lo, hi = 0, self.record_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < rid:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo == self.record_count or self._key_at(lo) != rid:
+            return None
+
+        _, owner, timestamp = _RECORD_STRUCT.unpack_from(
+            self._mm, HEADER_SIZE + lo * RECORD_SIZE
+        )
+        ts = datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+        return {
+            "owner": Web3.to_checksum_address("0x" + owner.hex()),
+            "timestamp": timestamp,
+            "timestamp_iso": ts,
+            "stored_hash": file_hash,
+            "metadata": None,
+        }
+
+    def close(self):
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def verify_file_offline(file_path: str, bundle: OfflineBundle) -> dict:
+    """
+    Sama seperti integrity_client.verify_file, tapi lookup ke bundle offline.
+    match hanya True kalau bundle ditandatangani oleh trusted signer.
+    """
+    file_hash = hash_file_sha256(file_path)
+    record = bundle.lookup(file_hash)
+
+    return {
+        "file_path": str(file_path),
+        "file_hash": file_hash,
+        "on_chain": record is not None,
+        "match": record is not None and bundle.trusted,
+        "trusted": bundle.trusted,
+        "record": record,
+    }
+
+
+def hash_file_sha256(file_path: str) -> str:
+    """
+    Hitung SHA-256 dari file (hex string).
+    Duplikat dari integrity_client karena modul itu langsung konek ke node saat di-import.
+    """
+    path = Path(file_path)
+    if not path.is_file():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    sha = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(8192), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
@@ -0,0 +1,112 @@
+from web3 import Web3
+from pathlib import Path
+import argparse
+import json
+import sys
+import timeit
+
+# Microbenchmark encode/decode registerFile & getFileRecord:
+#   web3 generic (contract.functions.X(...)) vs fast path (python_client/fast_abi.py)
+# Kesamaan output dengan web3 diuji di tests/test_fast_abi.py (python -m pytest).
+#
+#   python python_scripts/bench_call_encoding.py          # offline, tanpa node
+#   python python_scripts/bench_call_encoding.py --rpc    # + eth_call ke Ganache
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR / "python_client"))
+
+from fast_abi import (  # noqa: E402
+    encode_register_file,
+    encode_get_file_record,
+    decode_get_file_record,
+)
+
+RPC_URL = "http://127.0.0.1:8546"
+
+with (BASE_DIR / "contract_info.json").open() as f:
+    info = json.load(f)
+
+CONTRACT_ADDRESS = Web3.to_checksum_address(info["address"])
+w3 = Web3()
+contract = w3.eth.contract(address=CONTRACT_ADDRESS, abi=info["abi"])
+
+RETURN_TYPES = ["address", "uint256", "string", "string"]
+
+FILE_HASH = "92a438f7" * 8
+METADATA = "Initial evidence"
+OWNER = "0x90F8bf6A479f320ead074411a4B0e7944Ea8c9C1"
+
+
+def web3_encode_register(file_hash, metadata):
+    return bytes.fromhex(
+        contract.functions.registerFile(file_hash, metadata)._encode_transaction_data()[2:]
+    )
+
+
+def web3_encode_get(file_hash):
+    return bytes.fromhex(
+        contract.functions.getFileRecord(file_hash)._encode_transaction_data()[2:]
+    )
+
+
+def web3_decode_get(data):
+    # contract.functions.X().call() men-checksum address hasil decode; ikuti di sini
+    owner, timestamp, stored_hash, metadata = w3.codec.decode(RETURN_TYPES, data)
+    return Web3.to_checksum_address(owner), timestamp, stored_hash, metadata
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=5))
+    print(f" {label:<36} {number / seconds:>12,.0f} calls/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark call encoding: web3 vs fast path")
+    parser.add_argument("-n", "--number", type=int, default=20000, help="Iterasi per run")
+    parser.add_argument("--rpc", action="store_true", help="Ikut benchmark eth_call ke node")
+    parser.add_argument("--hash", help="Hash yang sudah terdaftar untuk benchmark --rpc")
+    args = parser.parse_args()
+
+    file_hash, metadata = FILE_HASH, METADATA
+    ret = w3.codec.encode(RETURN_TYPES, [OWNER, 1700000000, file_hash, metadata])
+
+    print("\n[ENCODE / DECODE]")
+    bench("registerFile encode  (web3)", lambda: web3_encode_register(file_hash, metadata), args.number)
+    bench("registerFile encode  (fast)", lambda: encode_register_file(file_hash, metadata), args.number)
+    bench("getFileRecord encode (web3)", lambda: web3_encode_get(file_hash), args.number)
+    bench("getFileRecord encode (fast)", lambda: encode_get_file_record(file_hash), args.number)
+    bench("getFileRecord decode (web3)", lambda: web3_decode_get(ret), args.number)
+    bench("getFileRecord decode (fast)", lambda: decode_get_file_record(ret), args.number)
+
+    if args.rpc:
+        node = Web3(Web3.HTTPProvider(RPC_URL))
+        if not node.is_connected():
+            raise RuntimeError(f"Cannot connect to {RPC_URL}. Pastikan 'npx ganache -p 8546' sedang berjalan.")
+        live = node.eth.contract(address=CONTRACT_ADDRESS, abi=info["abi"])
+
+        # getFileRecord revert untuk hash yang belum terdaftar; pakai --hash
+        # supaya yang diukur jalur sukses (termasuk decode)
+        call_hash = args.hash or file_hash
+        number = max(1, args.number // 100)
+
+        def web3_call():
+            try:
+                live.functions.getFileRecord(call_hash).call()
+            except Exception:
+                pass
+
+        def fast_call():
+            try:
+                decode_get_file_record(
+                    node.eth.call({"to": CONTRACT_ADDRESS, "data": encode_get_file_record(call_hash)})
+                )
+            except Exception:
+                pass
+
+        print("\n[RPC eth_call getFileRecord]")
+        bench("getFileRecord call   (web3)", web3_call, number)
+        bench("getFileRecord call   (fast)", fast_call, number)
+
+
+if __name__ == "__main__":
+    main()
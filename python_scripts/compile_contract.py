@@ -1,30 +1,54 @@
+import hashlib
+import json
+import sys
+
 import solcx
 from solcx import compile_standard
 
-# Install Solidity compiler versi 0.8.20
-solcx.install_solc("0.8.20")
+SOLC_VERSION = "0.8.20"
+SOURCE_PATH = "contracts/FileIntegrityRegistry.sol"
+BUILD_PATH = "build.json"
 
 # Load kontrak Solidity
-with open("contracts/FileIntegrityRegistry.sol", "r") as f:
+with open(SOURCE_PATH, "r") as f:
     source = f.read()
 
-# Compile
-compiled = compile_standard(
-    {
-        "language": "Solidity",
-        "sources": {"FileIntegrityRegistry.sol": {"content": source}},
-        "settings": {
-            "outputSelection": {
-                "*": {"*": ["abi", "evm.bytecode.object"]}
-            }
-        },
+compile_input = {
+    "language": "Solidity",
+    "sources": {"FileIntegrityRegistry.sol": {"content": source}},
+    "settings": {
+        "outputSelection": {
+            "*": {"*": ["abi", "evm.bytecode.object"]}
+        }
     },
-    solc_version="0.8.20",
-)
+}
+
+# Cache key: source + versi compiler + settings. Kalau sama dengan build.json
+# yang ada, compile (dan install solc) dilewati. Pakai --force untuk compile ulang.
+build_hash = hashlib.sha256(
+    json.dumps({"solc": SOLC_VERSION, "input": compile_input}, sort_keys=True).encode()
+).hexdigest()
+
+if "--force" not in sys.argv:
+    try:
+        with open(BUILD_PATH) as f:
+            cached = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        cached = {}
+    if cached.get("buildHash") == build_hash:
+        print(f"Source unchanged (build hash {build_hash[:12]}), skipping compile.")
+        sys.exit(0)
+
+# Install Solidity compiler versi 0.8.20 (hanya kalau belum ada)
+if SOLC_VERSION not in {str(v) for v in solcx.get_installed_solc_versions()}:
+    solcx.install_solc(SOLC_VERSION)
+
+# Compile
+compiled = compile_standard(compile_input, solc_version=SOLC_VERSION)
+compiled["buildHash"] = build_hash
 
 # Simpan output ke file build.json
-import json
-with open("build.json", "w") as f:
+with open(BUILD_PATH, "w") as f:
     json.dump(compiled, f, indent=2)
 
 print("Compiled successfully. ABI & bytecode saved to build.json")
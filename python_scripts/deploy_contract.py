@@ -1,6 +1,8 @@
 from web3 import Web3
 from pathlib import Path
+import hashlib
 import json
+import sys
 
 # RPC Ganache lokal (PAKAI PORT 8546)
 RPC_URL = "http://127.0.0.1:8546"
@@ -26,6 +28,21 @@ with build_path.open() as f:
 contract_interface = compiled["contracts"]["FileIntegrityRegistry.sol"]["FileIntegrityRegistry"]
 abi = contract_interface["abi"]
 bytecode = contract_interface["evm"]["bytecode"]["object"]
+bytecode_hash = hashlib.sha256(bytecode.encode()).hexdigest()
+
+out_path = BASE_DIR / "contract_info.json"
+
+# Lewati deploy kalau bytecode yang sama sudah ter-deploy dan kontraknya masih ada
+# di chain ini (Ganache yang di-restart akan kehilangan kontrak). --force untuk deploy ulang.
+if "--force" not in sys.argv and out_path.exists():
+    with out_path.open() as f:
+        existing = json.load(f)
+    if (
+        existing.get("bytecodeHash") == bytecode_hash
+        and w3.eth.get_code(Web3.to_checksum_address(existing["address"]))
+    ):
+        print(f"Contract unchanged and already deployed at: {existing['address']}, skipping deploy.")
+        sys.exit(0)
 
 account = w3.eth.accounts[0]
 print(f"Using deployer account: {account}")
@@ -39,12 +56,12 @@ tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
 contract_address = tx_receipt.contractAddress
 print(f"Contract deployed at: {contract_address}")
 
-out_path = BASE_DIR / "contract_info.json"
 with out_path.open("w") as f:
     json.dump(
         {
             "address": contract_address,
-            "abi": abi
+            "abi": abi,
+            "bytecodeHash": bytecode_hash,
         },
         f,
         indent=2
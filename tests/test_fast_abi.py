@@ -0,0 +1,114 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from web3 import Web3
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR / "python_client"))
+
+from fast_abi import (  # noqa: E402
+    GET_FILE_RECORD_SELECTOR,
+    REGISTER_FILE_SELECTOR,
+    decode_get_file_record,
+    encode_get_file_record,
+    encode_register_file,
+)
+
+with (BASE_DIR / "contract_info.json").open() as f:
+    ABI = json.load(f)["abi"]
+
+w3 = Web3()
+contract = w3.eth.contract(
+    address="0x0000000000000000000000000000000000000001", abi=ABI
+)
+
+RETURN_TYPES = ["address", "uint256", "string", "string"]
+OWNER = "0x90F8bf6A479f320ead074411a4B0e7944Ea8c9C1"
+
+STRINGS = [
+    "",
+    "x" * 31,
+    "y" * 32,
+    "z" * 33,
+    "a" * 64,
+    "bukti forensik ✓ 証拠",
+    "é" * 16,  # 32 byte UTF-8 dari 16 karakter
+    "m" * 1000,
+]
+
+PAIRS = [(h, m) for h in STRINGS for m in STRINGS[:5]] + [(STRINGS[5], STRINGS[6])]
+
+
+def web3_calldata(fn_name, *args):
+    return bytes.fromhex(
+        getattr(contract.functions, fn_name)(*args)._encode_transaction_data()[2:]
+    )
+
+
+def web3_decode(data):
+    # contract.functions.X().call() men-checksum address hasil decode
+    owner, timestamp, stored_hash, metadata = w3.codec.decode(RETURN_TYPES, data)
+    return Web3.to_checksum_address(owner), timestamp, stored_hash, metadata
+
+
+def test_selectors_match_abi():
+    assert REGISTER_FILE_SELECTOR == web3_calldata("registerFile", "", "")[:4]
+    assert GET_FILE_RECORD_SELECTOR == web3_calldata("getFileRecord", "")[:4]
+
+
+@pytest.mark.parametrize("file_hash,metadata", PAIRS)
+def test_encode_register_file_matches_web3(file_hash, metadata):
+    assert encode_register_file(file_hash, metadata) == web3_calldata(
+        "registerFile", file_hash, metadata
+    )
+
+
+@pytest.mark.parametrize("file_hash", STRINGS)
+def test_encode_get_file_record_matches_web3(file_hash):
+    assert encode_get_file_record(file_hash) == web3_calldata("getFileRecord", file_hash)
+
+
+@pytest.mark.parametrize("stored_hash,metadata", PAIRS)
+@pytest.mark.parametrize("timestamp", [0, 1700000000, 2**256 - 1])
+def test_decode_get_file_record_matches_web3(stored_hash, metadata, timestamp):
+    data = w3.codec.encode(RETURN_TYPES, [OWNER, timestamp, stored_hash, metadata])
+    assert decode_get_file_record(data) == web3_decode(data)
+
+
+def _valid_return():
+    return bytes(w3.codec.encode(RETURN_TYPES, [OWNER, 1700000000, "a" * 64, "meta"]))
+
+
+def _with_word(data, index, value):
+    start = index * 32
+    return data[:start] + value.to_bytes(32, "big") + data[start + 32:]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        _valid_return()[:127],  # head terpotong
+        _valid_return()[:-32],  # body string terakhir terpotong
+        _with_word(_valid_return(), 2, 10_000),  # offset string di luar data
+        _with_word(_valid_return(), 3, 2**255),  # offset sangat besar
+        _with_word(_valid_return(), 4, 10_000),  # length string di luar data
+        b"\xff" + _valid_return()[1:],  # padding address tidak nol
+    ],
+    ids=[
+        "empty",
+        "short-head",
+        "short-tail",
+        "offset-oob",
+        "offset-huge",
+        "length-oob",
+        "dirty-address-padding",
+    ],
+)
+def test_decode_malformed_return_raises_like_web3(data):
+    with pytest.raises(Exception):
+        web3_decode(data)
+    with pytest.raises(ValueError):
+        decode_get_file_record(data)